@@ -24,14 +24,15 @@ FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 DEALINGS IN THE SOFTWARE.
 """
 
-import asyncio, functools, warnings
+import asyncio, codecs, functools, json, sqlite3, threading, time, warnings
+from concurrent.futures import ThreadPoolExecutor
 
 import aiohttp, requests
 
 __all__ = (
     'LoginError',
     'UserNotFound',
-    'GroupNotGroup',
+    'GroupNotFound',
     'GameNotFound',
     'Logout',
     'AsyncEvent',
@@ -39,6 +40,11 @@ __all__ = (
     'User',
     'Game',
     'Group',
+    'Store',
+    'Thumbnails',
+    'AuthSession',
+    'MessageQueue',
+    'SessionManager',
     'Client'
 )
 
@@ -96,6 +102,194 @@ def unstable(message: str = None):
         return decorated
     return actual_decorator
 
+def chunked(items, size: int):
+    r"""
+    Split the items into lists of at most ``size`` elements.
+    """
+
+    items = list(items)
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+def gather(func, items, max_workers: int = 8):
+    r"""
+    Call ``func`` on every item from a thread pool and return the results in order.
+
+    An exception raised for an item is returned in place of its result, so one failure does not abort the others.
+    """
+
+    def call(item):
+        try:
+            return func(item)
+        except Exception as e:
+            return e
+
+    items = list(items)
+    if not items:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(call, items))
+
+def iter_json_items(chunks, key: str = 'data', meta: dict = None):
+    r"""
+    Yield the items of a JSON array while the chunks of the document arrive.
+
+    The array is either the document itself or the value of ``key`` in the top-level object,
+    the other top-level values (like the page cursors) are written to ``meta``.
+    """
+
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder('utf-8')()
+    chunks = iter(chunks)
+    meta = {} if meta is None else meta
+    buffer, pos, done = '', 0, False
+
+    def more():
+        nonlocal buffer, pos, done
+        chunk = next(chunks, None)
+        if chunk is None:
+            done = True
+            chunk = text.decode(b'', final=True)
+        else:
+            chunk = text.decode(chunk)
+        # The parsed part of the buffer is dropped, only the current item is kept in memory.
+        buffer, pos = buffer[pos:] + chunk, 0
+
+    def peek():
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in ' \t\r\n':
+                pos += 1
+            if pos < len(buffer) or done:
+                return buffer[pos:pos + 1]
+            more()
+
+    def value():
+        nonlocal pos
+        while True:
+            peek()
+            try:
+                obj, end = decoder.raw_decode(buffer, pos)
+                # An object, an array or a string is complete once decoded, but a number or a literal
+                # is only complete when a delimiter follows it: "1." would be decoded as 1.
+                if done or buffer[pos] in '{["' or (end < len(buffer) and buffer[end] in ',]} \t\r\n'):
+                    pos = end
+                    return obj
+            except json.JSONDecodeError:
+                if done:
+                    raise
+            more()
+
+    def items():
+        nonlocal pos
+        while True:
+            char = peek()
+            if char == ',':
+                pos += 1
+            elif char == ']':
+                pos += 1
+                return
+            elif not char:
+                raise ValueError('Unterminated JSON array.')
+            else:
+                yield value()
+
+    char = peek()
+    if char == '[':
+        pos += 1
+        yield from items()
+        return
+    if char != '{':
+        raise ValueError('Expected a JSON object or array.')
+    pos += 1
+    while True:
+        char = peek()
+        if char == ',':
+            pos += 1
+            continue
+        if char in ('}', ''):
+            return
+        name = value()
+        if peek() != ':':
+            raise ValueError('Expected a colon after a key.')
+        pos += 1
+        if name == key and peek() == '[':
+            pos += 1
+            yield from items()
+        else:
+            meta[name] = value()
+
+def paginate(session: requests.Session, url: str, params: dict = None, pages: int = None, key: str = 'data', chunk_size: int = 65536):
+    r"""
+    Yield the items of every page of a cursor paginated endpoint, each page is parsed while it downloads.
+    """
+
+    params = dict(params or {})
+    page = 0
+    while True:
+        resp = session.get(url, params=params, stream=True)
+        meta = {}
+        try:
+            if resp.status_code != 200:
+                raise Forbidden(resp.json()['errors'][0]['message'])
+            yield from iter_json_items(resp.iter_content(chunk_size=chunk_size), key, meta)
+        finally:
+            resp.close()
+        page += 1
+        cursor = meta.get('nextPageCursor')
+        if not cursor or (pages is not None and page >= pages):
+            return
+        params['cursor'] = cursor
+
+def error_message(data, default: str = 'Forbidden.'):
+    r"""
+    Get the message of a Roblox error payload.
+    """
+
+    try:
+        return data['errors'][0]['message']
+    except (KeyError, IndexError, TypeError):
+        return default
+
+class RateLimiter(object):
+    r"""
+    This object spaces out the calls so that at most ``rate`` of them start per second.
+    """
+
+    def __init__(self, rate: float) -> None:
+        self.interval = 1 / rate if rate else 0
+        self.next = 0.0
+
+    async def wait(self):
+        now = time.monotonic()
+        delay = self.next - now
+        # The slot is taken before sleeping, so concurrent callers queue up behind each other.
+        self.next = max(now, self.next) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+def fetch_group_json(session: requests.Session, id: int):
+    r"""
+    Fetch the full payload of a group from the single group endpoint.
+
+    Roblox answers 400 for a group that does not exist, a rate limit or a server error raises Forbidden instead.
+    """
+
+    r = session.get(f'https://groups.roblox.com/v1/groups/{id}')
+    data = r.json()
+    if r.status_code in (400, 404) or (r.status_code == 200 and 'id' not in data):
+        raise GroupNotFound(f"Group {id} does not exist.")
+    if r.status_code != 200:
+        raise Forbidden(error_message(data, f"Group {id} could not be fetched ({r.status_code})."))
+    return data
+
+def short_game(game: dict):
+    r"""
+    Keep the fields of a game that the games lists expose.
+    """
+
+    return {"id":game['id'],"name":game['name'],"description":game['description'],"creator":game['creator'],"rootPlace":game['rootPlace'],"created":game['created'],"updated":game['updated'],"placeVisits": game['placeVisits']}
+
 class User(object):
     r"""
     This object representing a user on Roblox.
@@ -134,11 +328,12 @@ class User(object):
         A list of all the user's username history.
     """
 
-    def __init__(self, json: dict, bot) -> None:
+    def __init__(self, json: dict, bot, store: "Store" = None) -> None:
         self.json = json
         self.base_url = "https://api.roblox.com"
         self.requests = requests.Session()
         self.bot = bot
+        self.store = store
     
     id = property(lambda self: self.json['Id'])
     username = property(lambda self: self.json['Username'])
@@ -178,18 +373,21 @@ class User(object):
         It is not called directly, but is called by a variable in the user object, "friends".
         """
 
-        __friends__ = []
-        resp = self.requests.get(f"{self.base_url}/users/{self.id}/friends")
-        for friend in resp.json():
-            id = friend['Id']
-            username = friend['Username']
-            avatarURL = friend['AvatarUri']
-            avatarFinal = friend['AvatarFinal']
-            is_online = friend['IsOnline']
-            user = {"Id": id, "Username": username, "AvatarUri": avatarURL, "AvatarFinal": avatarFinal, "IsOnline": is_online}
-            __friends__.append(User(user, self.bot))
-        self.requests.close()
-        return __friends__
+        return list(self.iter_friends())
+
+    def iter_friends(self):
+        r"""
+        This function yields the user's friends while the response downloads.
+        """
+
+        users = []
+        for friend in paginate(self.requests, f"{self.base_url}/users/{self.id}/friends"):
+            user = {"Id": friend['Id'], "Username": friend['Username'], "AvatarUri": friend['AvatarUri'], "AvatarFinal": friend['AvatarFinal'], "IsOnline": friend['IsOnline']}
+            if self.store:
+                users.append(user)
+            yield User(user, self.bot, self.store)
+        if self.store:
+            self.store.put_friends(self.id, [user['Id'] for user in users], users)
     
     def get_games(self):
         r"""
@@ -198,22 +396,18 @@ class User(object):
         It is not called directly, but is called by a variable in the user object, "games".
         """
 
-        __games__ = []
-        resp = self.requests.get(f"https://games.roblox.com/v2/users/{self.id}/games")
-        data = resp.json()
-        for game in data['data']:
-            id = game['id']
-            name = game['name']
-            description = game['description']
-            creator = game['creator']
-            rootPlace = game['rootPlace']
-            created = game['created']
-            updated = game['updated']
-            visits = game['placeVisits']
-            game = {"id":id,"name":name,"description":description,"creator":creator,"rootPlace":rootPlace,"created":created,"updated":updated,"placeVisits": visits}
-            __games__.append(game)
-        self.requests.close()
-        return __games__
+        return list(self.iter_games(pages=1))
+
+    def iter_games(self, limit: int = 10, pages: int = None):
+        r"""
+        This function yields the user's games page after page, while each page downloads.
+        """
+
+        for game in paginate(self.requests, f"https://games.roblox.com/v2/users/{self.id}/games", {'limit': limit}, pages):
+            game = short_game(game)
+            if self.store:
+                self.store.put_game_listing(game)
+            yield game
     
     def get_favorite_games(self):
         r"""
@@ -222,22 +416,18 @@ class User(object):
         It is not called directly, but is called by a variable in the user object, "favorite_games".
         """
 
-        __games__ = []
-        resp = self.requests.get(f"https://games.roblox.com/v2/users/{self.id}/favorite/games")
-        data = resp.json()
-        for game in data['data']:
-            id = game['id']
-            name = game['name']
-            description = game['description']
-            creator = game['creator']
-            rootPlace = game['rootPlace']
-            created = game['created']
-            updated = game['updated']
-            visits = game['placeVisits']
-            game = {"id":id,"name":name,"description":description,"creator":creator,"rootPlace":rootPlace,"created":created,"updated":updated,"placeVisits": visits}
-            __games__.append(game)
-        self.requests.close()
-        return __games__
+        return list(self.iter_favorite_games(pages=1))
+
+    def iter_favorite_games(self, limit: int = 10, pages: int = None):
+        r"""
+        This function yields the user's favorite games page after page, while each page downloads.
+        """
+
+        for game in paginate(self.requests, f"https://games.roblox.com/v2/users/{self.id}/favorite/games", {'limit': limit}, pages):
+            game = short_game(game)
+            if self.store:
+                self.store.put_game_listing(game)
+            yield game
     
     def get_description(self):
         r"""
@@ -318,6 +508,9 @@ class User(object):
         for username in data['data']:
             __usernames__.append(username)
         self.requests.close()
+        if self.store:
+            # These names are not the user's anymore, they must be resolved again.
+            self.store.forget_usernames([username['name'] for username in __usernames__], self.id)
         return __usernames__
 
     friends = property(get_friends)
@@ -453,6 +646,8 @@ class Game:
 
         return f"Game(id={self.id}, name={self.name}, description={self.description}, sourceName={self.sourceName}, sourceDescription={self.sourceDescription}, creator={self.creator}, price={self.price}, allowedGearGenres={self.allowedGearGenres}, allowedGearCategories={self.allowedGearCategories}, isGenreEnforced={self.isGenreEnforced}, copyingAllowed={self.copyingAllowed}, playing={self.playing}, visits={self.visits}, maxPlayers={self.maxPlayers}, created={self.created}, updated={self.updated}, studioAccessToApisAllowed={self.studioAccessToApisAllowed}, createVipServersAllowed={self.createVipServersAllowed}, universeAvatarType={self.universeAvatarType}, genre={self.genre}, isAllGenre={self.isAllGenre}, isFavoritedByUser={self.isFavoritedByUser}, favoritedCount={self.favoritedCount})"
 
+GROUP_FIELDS = ('id', 'name', 'description', 'owner', 'shout', 'memberCount', 'isBuildersClubOnly', 'publicEntryAllowed', 'hasVerifiedBadge')
+
 class Group:
     r"""
     This object represents a group on Roblox.
@@ -487,20 +682,36 @@ class Group:
         Get someones roles in the group.
     """
 
-    def __init__(self, json: dict) -> None:
+    def __init__(self, json: dict, store: "Store" = None) -> None:
         self.json = json
         self.requests = requests.Session()
+        self.store = store
     
     id = property(lambda self: self.json['id'])
     name = property(lambda self: self.json['name'])
     description = property(lambda self: self.json['description'])
-    owner = property(lambda self: self.json['owner'])
-    shout = property(lambda self: self.json['shout'])
-    member = property(lambda self: self.json['memberCount'])
-    buildersClubOnly = property(lambda self: self.json['isBuildersClubOnly'])
-    is_public = property(lambda self: self.json['publicEntryAllowed'])
+    owner = property(lambda self: self.get_field('owner'))
+    shout = property(lambda self: self.get_field('shout'))
+    member = property(lambda self: self.get_field('memberCount'))
+    buildersClubOnly = property(lambda self: self.get_field('isBuildersClubOnly'))
+    is_public = property(lambda self: self.get_field('publicEntryAllowed'))
     has_badge = property(lambda self: self.json['hasVerifiedBadge'])
 
+    def get_field(self, key: str):
+        r"""
+        This function returns a field of the group's payload.
+
+        The groups fetched in batch miss some fields (owner, shout, member count...), they are completed
+        from the single group endpoint the first time one of them is read.
+        """
+
+        if key not in self.json:
+            self.json = {**self.json, **fetch_group_json(self.requests, self.id)}
+            self.requests.close()
+            if self.store:
+                self.store.put_group(self.json)
+        return self.json[key]
+
     def __str__(self):
         r"""
         This function is called when the group is printed.
@@ -527,38 +738,22 @@ class Group:
         return f"Group(id={self.id}, name={self.name}, description={self.description}, owner={self.owner}, shout={self.shout}, member={self.member}, builderClubOnly={self.buildersClubOnly}, is_public={self.is_public}, badge={self.has_badge}, games={self.games}, wall_posts={self.wall_posts})"
 
     def get_games(self):
-        __games__ = []
-        resp = self.requests.get(f"https://games.roblox.com/v2/groups/{self.id}/games")
-        data = resp.json()
-        for game in data['data']:
-            id = game['id']
-            name = game['name']
-            description = game['description']
-            creator = game['creator']
-            rootPlace = game['rootPlace']
-            created = game['created']
-            updated = game['updated']
-            visits = game['placeVisits']
-            game = {"id":id,"name":name,"description":description,"creator":creator,"rootPlace":rootPlace,"created":created,"updated":updated,"placeVisits": visits}
-            __games__.append(game)
-        self.requests.close()
-        return __games__
+        return list(self.iter_games(pages=1))
+
+    def iter_games(self, limit: int = 10, pages: int = None):
+        for game in paginate(self.requests, f"https://games.roblox.com/v2/groups/{self.id}/games", {'limit': limit}, pages):
+            game = short_game(game)
+            if self.store:
+                self.store.put_game_listing(game)
+            yield game
     
     def get_wall_posts(self, limit: int = 10):
-        __wall_posts__ = []
-        try:
-            resp = self.requests.get(f"https://groups.roblox.com/v2/groups/{self.id}/wall/posts?sortOrder=Desc&limit={limit}")
-            if resp.status_code == 200:
-                data = resp.json()
-                for wall_post in data['data']:
-                    post = wall_post
-                    __wall_posts__.append(post)
-                    self.requests.close()
-                return __wall_posts__
-            else:
-                raise Forbidden(resp.json()['errors'][0]['message'])
-        except KeyError:
+        return list(self.iter_wall_posts(limit, pages=1))
+
+    def iter_wall_posts(self, limit: int = 10, pages: int = None):
+        if limit not in (10, 25, 50, 100):
             raise ValueError(f"Allowed values for the limit: 10, 25, 50, 100")
+        yield from paginate(self.requests, f"https://groups.roblox.com/v2/groups/{self.id}/wall/posts", {'sortOrder': 'Desc', 'limit': limit}, pages)
 
     def get_roles(self, _id: int):
         __roles__ = []
@@ -569,6 +764,8 @@ class Group:
             role = {'data':group}
             __roles__.append(role)
         self.requests.close()
+        if self.store:
+            self.store.put_memberships(_id, {role['group']['id']: role.get('role') for role in data['data']})
         return __roles__
 
     games = property(get_games)
@@ -589,6 +786,618 @@ class Group:
             self.requests.close()
             raise Forbidden(resp.json()['errors'][0]['message'])
 
+class Store(object):
+    r"""
+    This object is a local SQLite copy of the users, games, groups and friends fetched by the client.
+
+    Attributes:
+    -----------
+    path: <class 'str'>
+        The path of the database file, ":memory:" keeps it in memory.
+    max_age: <class 'int'>
+        How many seconds a stored row is fresh enough to be served instead of the API.
+    get_user: <class 'method'>
+        Get a stored user payload by id.
+    get_game: <class 'method'>
+        Get a stored game payload by id.
+    get_group: <class 'method'>
+        Get a stored group payload by id.
+    find_users: <class 'method'>
+        Get the stored user payloads with a username.
+    games_by_creator: <class 'method'>
+        Get the stored game payloads made by a user or a group, the ones only seen in a games list are partial.
+    get_user_id: <class 'method'>
+        Get the stored id of a username.
+    friends_of: <class 'method'>
+        Get the ids of a user's stored friends.
+    groups_of: <class 'method'>
+        Get the ids of the stored groups of a user.
+    members_of: <class 'method'>
+        Get the ids of the stored members of a group.
+    """
+
+    schema = """
+        CREATE TABLE IF NOT EXISTS users (id INTEGER PRIMARY KEY, username TEXT COLLATE NOCASE, json TEXT NOT NULL, fetched REAL NOT NULL);
+        CREATE INDEX IF NOT EXISTS users_username ON users (username);
+        CREATE TABLE IF NOT EXISTS usernames (username TEXT COLLATE NOCASE PRIMARY KEY, id INTEGER NOT NULL, fetched REAL NOT NULL);
+        CREATE INDEX IF NOT EXISTS usernames_id ON usernames (id);
+        CREATE TABLE IF NOT EXISTS games (id INTEGER PRIMARY KEY, creator_id INTEGER, creator_type TEXT, json TEXT NOT NULL, fetched REAL NOT NULL);
+        CREATE INDEX IF NOT EXISTS games_creator ON games (creator_id, creator_type);
+        CREATE TABLE IF NOT EXISTS game_listings (id INTEGER PRIMARY KEY, creator_id INTEGER, creator_type TEXT, json TEXT NOT NULL, fetched REAL NOT NULL);
+        CREATE INDEX IF NOT EXISTS game_listings_creator ON game_listings (creator_id, creator_type);
+        CREATE TABLE IF NOT EXISTS groups (id INTEGER PRIMARY KEY, json TEXT NOT NULL, fetched REAL NOT NULL);
+        CREATE TABLE IF NOT EXISTS friends (user_id INTEGER NOT NULL, friend_id INTEGER NOT NULL, fetched REAL NOT NULL, PRIMARY KEY (user_id, friend_id));
+        CREATE INDEX IF NOT EXISTS friends_friend ON friends (friend_id);
+        CREATE TABLE IF NOT EXISTS memberships (user_id INTEGER NOT NULL, group_id INTEGER NOT NULL, role TEXT, fetched REAL NOT NULL, PRIMARY KEY (user_id, group_id));
+        CREATE INDEX IF NOT EXISTS memberships_group ON memberships (group_id);
+    """
+
+    def __init__(self, path: str = 'roblox.db', max_age: int = 3600) -> None:
+        self.path = path
+        self.max_age = max_age
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        with self.lock, self.db:
+            self.db.executescript(self.schema)
+
+    def close(self):
+        self.db.close()
+
+    def _execute(self, query: str, *args):
+        with self.lock, self.db:
+            return self.db.execute(query, args).fetchall()
+
+    def _fresh(self, table: str, id: int, max_age: int = None):
+        max_age = self.max_age if max_age is None else max_age
+        rows = self._execute(f"SELECT json FROM {table} WHERE id = ? AND fetched >= ?", id, time.time() - max_age)
+        return json.loads(rows[0][0]) if rows else None
+
+    def _write_users(self, users: list, now: float):
+        # Called inside a transaction.
+        self.db.executemany("INSERT OR REPLACE INTO users VALUES (?, ?, ?, ?)", [(data['Id'], data['Username'], json.dumps(data), now) for data in users])
+        # Any other name stored for these ids is an old one.
+        self.db.executemany("DELETE FROM usernames WHERE id = ? AND username != ?", [(data['Id'], data['Username']) for data in users])
+        self.db.executemany("INSERT OR REPLACE INTO usernames VALUES (?, ?, ?)", [(data['Username'], data['Id'], now) for data in users])
+
+    def put_user(self, data: dict):
+        self.put_users([data])
+
+    def put_users(self, users: list):
+        with self.lock, self.db:
+            self._write_users(users, time.time())
+
+    def put_usernames(self, ids: dict):
+        now = time.time()
+        with self.lock, self.db:
+            self.db.executemany("INSERT OR REPLACE INTO usernames VALUES (?, ?, ?)", [(username, id, now) for username, id in ids.items()])
+
+    def forget_usernames(self, usernames: list, id: int = None):
+        with self.lock, self.db:
+            if id is None:
+                self.db.executemany("DELETE FROM usernames WHERE username = ?", [(username,) for username in usernames])
+            else:
+                self.db.executemany("DELETE FROM usernames WHERE username = ? AND id = ?", [(username, id) for username in usernames])
+
+    def put_game(self, data: dict):
+        creator = data.get('creator') or {}
+        self._execute("INSERT OR REPLACE INTO games VALUES (?, ?, ?, ?, ?)", data['id'], creator.get('id'), creator.get('type'), json.dumps(data), time.time())
+
+    def put_game_listing(self, data: dict):
+        # The games lists only have a few fields, they are kept apart so they are never served as a Game.
+        creator = data.get('creator') or {}
+        self._execute("INSERT OR REPLACE INTO game_listings VALUES (?, ?, ?, ?, ?)", data['id'], creator.get('id'), creator.get('type'), json.dumps(data), time.time())
+
+    def put_group(self, data: dict):
+        self._execute("INSERT OR REPLACE INTO groups VALUES (?, ?, ?)", data['id'], json.dumps(data), time.time())
+
+    def put_friends(self, user_id: int, friend_ids: list, users: list = ()):
+        now = time.time()
+        with self.lock, self.db:
+            # The friends' payloads and the edges are written in the same transaction.
+            self._write_users(users, now)
+            # The new list replaces the old one, so removed friends do not linger.
+            self.db.execute("DELETE FROM friends WHERE user_id = ?", (user_id,))
+            self.db.executemany("INSERT OR REPLACE INTO friends VALUES (?, ?, ?)", [(user_id, friend_id, now) for friend_id in friend_ids])
+
+    def put_memberships(self, user_id: int, roles: dict):
+        now = time.time()
+        with self.lock, self.db:
+            # The new list replaces the old one, so left groups do not linger.
+            self.db.execute("DELETE FROM memberships WHERE user_id = ?", (user_id,))
+            self.db.executemany("INSERT INTO memberships VALUES (?, ?, ?, ?)", [(user_id, group_id, json.dumps(role), now) for group_id, role in roles.items()])
+
+    def get_user(self, id: int, max_age: int = None):
+        return self._fresh('users', id, max_age)
+
+    def get_game(self, id: int, max_age: int = None):
+        return self._fresh('games', id, max_age)
+
+    def get_group(self, id: int, max_age: int = None):
+        return self._fresh('groups', id, max_age)
+
+    def get_user_id(self, username: str, max_age: int = None):
+        max_age = self.max_age if max_age is None else max_age
+        rows = self._execute("SELECT id FROM usernames WHERE username = ? AND fetched >= ?", username, time.time() - max_age)
+        return rows[0][0] if rows else None
+
+    def find_users(self, username: str):
+        return [json.loads(row[0]) for row in self._execute("SELECT json FROM users WHERE username = ?", username)]
+
+    def games_by_creator(self, creator_id: int, creator_type: str = None):
+        where = "creator_id = ?" + (" AND creator_type = ?" if creator_type else "")
+        args = (creator_id, creator_type) if creator_type else (creator_id,)
+        # A full payload wins over the listing of the same game.
+        rows = self._execute(f"SELECT json FROM games WHERE {where} UNION ALL SELECT json FROM game_listings WHERE {where} AND id NOT IN (SELECT id FROM games)", *args, *args)
+        return [json.loads(row[0]) for row in rows]
+
+    def friends_of(self, user_id: int):
+        return [row[0] for row in self._execute("SELECT friend_id FROM friends WHERE user_id = ?", user_id)]
+
+    def groups_of(self, user_id: int):
+        return [row[0] for row in self._execute("SELECT group_id FROM memberships WHERE user_id = ?", user_id)]
+
+    def members_of(self, group_id: int):
+        return [row[0] for row in self._execute("SELECT user_id FROM memberships WHERE group_id = ?", group_id)]
+
+class Thumbnails(object):
+    r"""
+    This object resolves the thumbnails of users, games and groups with the thumbnails service.
+
+    Attributes:
+    -----------
+    ttl: <class 'int'>
+        How many seconds a resolved url is kept.
+    retries: <class 'int'>
+        How many times the thumbnails that are still pending are asked again.
+    users: <class 'method'>
+        Get the avatar urls of many users.
+    games: <class 'method'>
+        Get the icon urls of many games by universe id.
+    groups: <class 'method'>
+        Get the icon urls of many groups.
+    """
+
+    def __init__(self, session: requests.Session = None, ttl: int = 600, retries: int = 5, delay: float = 1.0, max_workers: int = 8) -> None:
+        self.requests = session or requests.Session()
+        self.ttl = ttl
+        self.retries = retries
+        self.delay = delay
+        self.max_workers = max_workers
+        self.cache = {}
+        self.prune_size = 1024
+        self.lock = threading.Lock()
+
+    def users(self, ids, type: str = 'AvatarHeadShot', size: str = '150x150', format: str = 'Png', is_circular: bool = False):
+        return self.fetch(ids, type, size, format, is_circular)
+
+    def games(self, ids, size: str = '150x150', format: str = 'Png', is_circular: bool = False):
+        return self.fetch(ids, 'GameIcon', size, format, is_circular)
+
+    def groups(self, ids, size: str = '150x150', format: str = 'Png', is_circular: bool = False):
+        return self.fetch(ids, 'GroupIcon', size, format, is_circular)
+
+    def _remember(self, key: tuple, url: str):
+        now = time.time()
+        with self.lock:
+            if len(self.cache) >= self.prune_size:
+                # The expired urls are dropped so the cache does not grow for the life of the process.
+                self.cache = {key: cached for key, cached in self.cache.items() if cached[1] > now}
+                self.prune_size = max(1024, 2 * len(self.cache))
+            self.cache[key] = (url, now + self.ttl)
+
+    def _batch(self, chunk, type, size, format, is_circular):
+        data = [{"requestId": f"{id}:{type}:{size}", "targetId": id, "type": type, "size": size, "format": format, "isCircular": is_circular} for id in chunk]
+        r = self.requests.post('https://thumbnails.roblox.com/v1/batch', json=data)
+        if r.status_code == 429 or r.status_code >= 500:
+            # Asked again with the pending thumbnails.
+            return None
+        if r.status_code != 200:
+            raise Forbidden(error_message(r.json(), f"Thumbnails could not be resolved ({r.status_code})."))
+        return r.json()['data']
+
+    def fetch(self, ids, type: str, size: str = '150x150', format: str = 'Png', is_circular: bool = False):
+        r"""
+        This function returns a dict of id -> url for many thumbnails of the same type.
+        Like this:
+
+        -----------
+        import roblox
+
+        client = roblox.Client(email="email@example.com", username="Example", password="Example")
+
+        urls = client.thumbnails.users(ids=[1, 156])
+
+        client.login("roblosecurity")
+        -----------
+
+        The ids are sent 100 at a time, the pending ones are asked again until they settle, and the url is
+        None for a thumbnail that is blocked or still pending after all the retries. A request refused for
+        another reason than a rate limit or a server error (a wrong size or type...) raises Forbidden.
+        """
+
+        ids = list(dict.fromkeys(int(id) for id in ids))
+        urls = {}
+        now = time.time()
+        with self.lock:
+            for id in ids:
+                cached = self.cache.get((type, id, size, format, is_circular))
+                if cached and cached[1] > now:
+                    urls[id] = cached[0]
+
+        pending = [id for id in ids if id not in urls]
+        batch = functools.partial(self._batch, type=type, size=size, format=format, is_circular=is_circular)
+        for attempt in range(self.retries + 1):
+            if not pending:
+                break
+            if attempt:
+                time.sleep(self.delay * 2 ** (attempt - 1))
+            chunks = list(chunked(pending, 100))
+            pending = []
+            for chunk, result in zip(chunks, gather(batch, chunks, self.max_workers)):
+                if isinstance(result, Exception):
+                    raise result
+                if result is None:
+                    pending.extend(chunk)
+                    continue
+                for thumbnail in result:
+                    id = thumbnail['targetId']
+                    if thumbnail['state'] in ('Pending', 'TemporarilyUnavailable'):
+                        pending.append(id)
+                    elif thumbnail['state'] in ('Completed', 'Blocked'):
+                        urls[id] = thumbnail.get('imageUrl') if thumbnail['state'] == 'Completed' else None
+                        self._remember((type, id, size, format, is_circular), urls[id])
+                    else:
+                        urls[id] = None
+
+        return {id: urls.get(id) for id in ids}
+
+class AuthSession(object):
+    r"""
+    This object is an authenticated session on Roblox, it keeps the account's X-CSRF-Token.
+
+    Attributes:
+    -----------
+    roblosecurity: <class 'str'>
+        The .ROBLOSECURITY cookie of the account.
+    csrf_token: <class 'str'> or <class 'NoneType'>
+        The cached X-CSRF-Token, it is refreshed when Roblox challenges a request with a new one.
+    user_id: <class 'int'> or <class 'NoneType'>
+        The id of the account, once fetched.
+    limiter: <class 'roblox.RateLimiter'>
+        Spaces out the requests of the account, ``rate`` per second.
+    blocked_until: <class 'float'>
+        When the account can be used again after Roblox rate limited it.
+    acquire: <class 'method'>
+        Wait until the account can make a request.
+    request: <class 'method'>
+        Make an authenticated request.
+    """
+
+    def __init__(self, roblosecurity: str, headers: dict = None, rate: float = None, cooldown: float = 60) -> None:
+        self.roblosecurity = roblosecurity
+        self.headers = headers or {}
+        self.csrf_token = None
+        self.user_id = None
+        self.session = None
+        self.limiter = RateLimiter(rate)
+        self.cooldown = cooldown
+        self.blocked_until = 0.0
+
+    async def acquire(self):
+        await self.limiter.wait()
+        while self.blocked_until > time.monotonic():
+            await asyncio.sleep(self.blocked_until - time.monotonic())
+        return self
+
+    async def open(self):
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(headers=self.headers, cookies={'.ROBLOSECURITY': self.roblosecurity})
+        return self.session
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+
+    async def refresh_csrf(self):
+        r"""
+        Fetch a new X-CSRF-Token, the logout is refused without a token and the refusal carries a fresh one.
+        """
+
+        session = await self.open()
+        async with session.post('https://auth.roblox.com/v2/logout') as resp:
+            self.csrf_token = resp.headers.get('X-CSRF-Token', self.csrf_token)
+        return self.csrf_token
+
+    async def request(self, method: str, url: str, headers: dict = None, **kwargs):
+        r"""
+        Make an authenticated request and return its status and its json.
+
+        A 403 carrying a new X-CSRF-Token is a token challenge, the request is sent again once with that token.
+        A 429 blocks the account for ``cooldown`` seconds.
+        """
+
+        session = await self.open()
+        for attempt in range(2):
+            _headers = dict(headers or {})
+            # Another request may store a new token while this one is in flight, the challenge is compared to the token sent.
+            sent = self.csrf_token
+            if sent:
+                _headers['X-CSRF-Token'] = sent
+            async with session.request(method, url, headers=_headers, **kwargs) as resp:
+                token = resp.headers.get('X-CSRF-Token')
+                if resp.status == 403 and token and token != sent and not attempt:
+                    self.csrf_token = token
+                    continue
+                if resp.status == 429:
+                    self.blocked_until = time.monotonic() + self.cooldown
+                try:
+                    return resp.status, await resp.json(content_type=None)
+                except ValueError:
+                    # Gateway errors and empty rate limit answers have no json body.
+                    return resp.status, None
+
+    async def fetch_user_id(self):
+        if self.user_id is None:
+            status, data = await self.request('GET', 'https://users.roblox.com/v1/users/authenticated')
+            if status != 200:
+                raise LoginError(error_message(data, 'Invalid .ROBLOSECURITY cookie.'))
+            self.user_id = data['id']
+        return self.user_id
+
+class SessionManager(object):
+    r"""
+    This object pools several authenticated accounts and spreads the requests across them.
+
+    It does not own an event loop, its coroutines run on the loop of the caller.
+
+    Attributes:
+    -----------
+    sessions: <class 'list'>
+        The AuthSession of every account.
+    rate: <class 'float'> or <class 'NoneType'>
+        How many requests each account can make per second.
+    add: <class 'method'>
+        Add an account by its .ROBLOSECURITY cookie.
+    remove: <class 'method'>
+        Remove an account and close its session.
+    acquire: <class 'method'>
+        Wait for the account that can make a request first, and return it.
+    request: <class 'method'>
+        Make an authenticated request from the pool.
+    """
+
+    def __init__(self, roblosecurities: list = (), headers: dict = None, rate: float = 1.0, cooldown: float = 60) -> None:
+        self.headers = headers or {}
+        self.rate = rate
+        self.cooldown = cooldown
+        self.sessions = []
+        for roblosecurity in roblosecurities:
+            self.add(roblosecurity)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    def add(self, roblosecurity: str):
+        for session in self.sessions:
+            if session.roblosecurity == roblosecurity:
+                return session
+        session = AuthSession(roblosecurity, self.headers, self.rate, self.cooldown)
+        self.sessions.append(session)
+        return session
+
+    async def remove(self, session: AuthSession):
+        if session in self.sessions:
+            self.sessions.remove(session)
+        await session.close()
+
+    async def acquire(self):
+        if not self.sessions:
+            raise LoginError('No account was added to the session manager.')
+        while True:
+            # The choice and the slot reservation happen without awaiting, so concurrent callers spread out.
+            session = min(self.sessions, key=lambda session: max(session.limiter.next, session.blocked_until))
+            delay = session.blocked_until - time.monotonic()
+            if delay > 0:
+                # Every account is rate limited.
+                await asyncio.sleep(delay)
+            await session.limiter.wait()
+            # The account may have been rate limited while waiting for its slot, another one is picked then.
+            if session.blocked_until <= time.monotonic():
+                return session
+
+    async def request(self, method: str, url: str, **kwargs):
+        r"""
+        This function makes a request from the account that is free first.
+        Like this:
+
+        -----------
+        import roblox
+
+        async def main(manager: roblox.SessionManager):
+            status, data = await manager.request('GET', 'https://users.roblox.com/v1/users/authenticated')
+        -----------
+
+        A request rate limited on one account is sent again from another one.
+        """
+
+        for attempt in range(len(self.sessions) or 1):
+            session = await self.acquire()
+            status, data = await session.request(method, url, **kwargs)
+            if status != 429:
+                break
+        return status, data
+
+    async def close(self):
+        await asyncio.gather(*(session.close() for session in self.sessions))
+
+class MessageQueue(object):
+    r"""
+    This object sends private messages and group wall posts from async workers.
+
+    Attributes:
+    -----------
+    session: <class 'roblox.AuthSession'> or <class 'roblox.SessionManager'>
+        The account, or the pool of accounts, the messages are sent from.
+    workers: <class 'int'>
+        How many messages are sent at the same time.
+    rate: <class 'float'>
+        How many messages can be sent per second in total.
+    per_recipient: <class 'float'>
+        How many messages can be sent per second to the same user or group.
+    retries: <class 'int'>
+        How many times a message is sent again after a rate limit or a server error.
+    close_session: <class 'bool'>
+        Whether closing the queue closes its session too, for a session the queue owns.
+    send: <class 'method'>
+        Queue a private message, returns a future of the delivery.
+    post: <class 'method'>
+        Queue a group wall post, returns a future of the delivery.
+    join: <class 'method'>
+        Wait until every queued message is delivered or failed.
+    """
+
+    def __init__(self, session, workers: int = 4, rate: float = 2.0, per_recipient: float = 0.2, retries: int = 3, close_session: bool = False) -> None:
+        self.session = session
+        self.close_session = close_session
+        self.workers = workers
+        self.rate = rate
+        self.per_recipient = per_recipient
+        self.retries = retries
+        self.limiter = RateLimiter(rate)
+        self.recipients = {}
+        self.prune_size = 1024
+        self.queue = None
+        self.tasks = []
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    def start(self):
+        if self.queue is None:
+            self.queue = asyncio.Queue()
+        if not self.tasks:
+            self.tasks = [asyncio.ensure_future(self._worker()) for _ in range(self.workers)]
+
+    async def join(self):
+        if self.queue is not None:
+            await self.queue.join()
+
+    async def close(self):
+        await self.join()
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks = []
+        if self.close_session:
+            await self.session.close()
+
+    def send(self, user_id: int, title: str, value: str, **kwargs):
+        r"""
+        This function queues a private message.
+        Like this:
+
+        -----------
+        import asyncio, roblox
+
+        async def main():
+            async with roblox.MessageQueue(roblox.AuthSession("roblosecurity")) as queue:
+                deliveries = [queue.send(id, "Hello", "World") for id in (1, 156)]
+                for delivery in asyncio.as_completed(deliveries):
+                    try:
+                        print(await delivery)
+                    except roblox.Forbidden as e:
+                        print(e)
+
+        asyncio.run(main())
+        -----------
+        """
+
+        data = {
+            "subject": title,
+            "body": value,
+            "recipientId": user_id,
+            "replyMessageId": kwargs.get('replyMessageId', None),
+            "includePreviousMessage": kwargs.get('includePreviousMessage', False),
+        }
+        return self._put(('user', user_id), "https://privatemessages.roblox.com/v1/messages/send", data)
+
+    def post(self, group_id: int, message: str):
+        data = {
+            "body": message,
+            "captchaId": "",
+            "captchaToken": "None",
+            "captchaProvider": "PROVIDER_ARKOSE_LABS"
+        }
+        return self._put(('group', group_id), f"https://groups.roblox.com/v2/groups/{group_id}/wall/posts", data)
+
+    def _put(self, recipient: tuple, url: str, data: dict):
+        self.start()
+        future = asyncio.get_event_loop().create_future()
+        self.queue.put_nowait((recipient, url, data, future, 0))
+        return future
+
+    def _defer(self, item: tuple, delay: float):
+        def put():
+            # The item is queued again before the old one is marked done, so join() keeps waiting for it.
+            self.queue.put_nowait(item)
+            self.queue.task_done()
+        asyncio.get_event_loop().call_later(delay, put)
+
+    def _recipient_delay(self, recipient: tuple):
+        now = time.monotonic()
+        if len(self.recipients) >= self.prune_size:
+            # A recipient whose next slot has passed needs no state, the idle ones are dropped.
+            self.recipients = {key: next for key, next in self.recipients.items() if next > now}
+            self.prune_size = max(1024, 2 * len(self.recipients))
+        delay = self.recipients.get(recipient, 0.0) - now
+        if delay <= 0:
+            self.recipients[recipient] = now + (1 / self.per_recipient if self.per_recipient else 0)
+        return delay
+
+    async def _worker(self):
+        while True:
+            item = await self.queue.get()
+            recipient, url, data, future, attempt = item
+            delay = self._recipient_delay(recipient)
+            if delay > 0:
+                # The worker goes on with the other recipients instead of waiting for this one.
+                self._defer(item, delay)
+                continue
+            try:
+                status, resp = await self._deliver(url, data)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if (status == 429 or status >= 500) and attempt < self.retries:
+                    self._defer((recipient, url, data, future, attempt + 1), 2 ** attempt)
+                    continue
+                if not future.done():
+                    if status != 200:
+                        future.set_exception(Forbidden(error_message(resp)))
+                    elif isinstance(resp, dict) and resp.get('success') is False:
+                        future.set_exception(Forbidden(resp.get('message') or 'The message was not sent.'))
+                    else:
+                        future.set_result(resp)
+            self.queue.task_done()
+
+    async def _deliver(self, url: str, data: dict):
+        await self.limiter.wait()
+        session = await self.session.acquire()
+        if 'recipientId' in data:
+            try:
+                data['userId'] = await session.fetch_user_id()
+            except LoginError as e:
+                raise Forbidden(str(e))
+        return await session.request('POST', url, json=data)
+
 class Client(object):
     r"""
     This object will build the bot
@@ -601,33 +1410,68 @@ class Client(object):
         Fetch a game from Roblox by rootid.
     fetch_group: <class 'method'>
         Fetch a group from Roblox by id.
+    fetch_groups: <class 'method'>
+        Fetch many groups from Roblox by id.
     get_user: <class 'method'>
         Get a user from Roblox by username.
+    resolve_usernames: <class 'method'>
+        Get the ids of many usernames.
     listen: <class 'method'>
         This method serves as an event on the bot.
     login: <class 'method'>
         Login to Roblox.
+    store: <class 'roblox.Store'> or <class 'NoneType'>
+        The local copy the fetched objects are written to, and read from while they are fresh.
+    thumbnails: <class 'roblox.Thumbnails'>
+        Resolve the thumbnail urls of users, games and groups.
+    message_queue: <class 'method'>
+        Build a queue that sends messages and wall posts from an account.
+    sessions: <class 'roblox.SessionManager'>
+        The accounts logged in, authenticated requests are spread across them.
+    start: <class 'method'>
+        Login to Roblox from a running event loop.
+    add_account: <class 'method'>
+        Add another account to the pool of sessions.
+    close: <class 'method'>
+        Close the sessions of the client from its event loop.
     """
 
-    def __init__(self, email: str, username: str, password: str) -> None:
+    def __init__(self, email: str, username: str, password: str, store: Store = None) -> None:
         self.email = email
         self.username = username
         self.password = password
+        self.store = store
         self.events = ["on_ready", "on_client_error"]
 
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/80.0.3987.149 Safari/537.36'
         }
         self.session = aiohttp.ClientSession(headers=self.headers)
+        self.sessions = SessionManager(headers=self.headers)
         self.requests = requests.Session()
+        self.thumbnails = Thumbnails(self.requests)
         self.base_url = 'https://api.roblox.com'
-        resp = self.requests.get(f'{self.base_url}/users/get-by-username?username={self.username}')
-        data = resp.json()
+        data = None
+        if self.store:
+            id = self.store.get_user_id(self.username)
+            data = self.store.get_user(id) if id else None
+        if not data:
+            resp = self.requests.get(f'{self.base_url}/users/get-by-username?username={self.username}')
+            data = resp.json()
+            if self.store and 'Id' in data:
+                self.store.put_user(data)
         user = User(data, data)
         self.bot = user
     
-    def __del__(self):
-        asyncio.get_event_loop().run_until_complete(self.session.close())
+    async def close(self):
+        r"""
+        This function closes the client's aiohttp session and the session of every pooled account.
+
+        It is awaited on the loop the client was started on, login() calls it when it stops.
+        """
+
+        await self.session.close()
+        await self.sessions.close()
     
     def fetch_user(self, id: int):
         r"""
@@ -645,11 +1489,17 @@ class Client(object):
         client.login("roblosecurity")
         """
 
-        try:
-            r = self.requests.get(f'{self.base_url}/users/{id}')
-            return User(r.json(), self.bot)
-        except KeyError:
+        if self.store:
+            data = self.store.get_user(id)
+            if data:
+                return User(data, self.bot, self.store)
+        r = self.requests.get(f'{self.base_url}/users/{id}')
+        data = r.json()
+        if 'Id' not in data:
             raise UserNotFound(f"User {id} does not exist.")
+        if self.store:
+            self.store.put_user(data)
+        return User(data, self.bot, self.store)
     
     def fetch_game(self, rootid: int):
         r"""
@@ -667,12 +1517,18 @@ class Client(object):
         client.login("roblosecurity")
         """
 
+        if self.store:
+            data = self.store.get_game(rootid)
+            if data:
+                return Game(data)
         try:
             r = self.requests.get(f'https://games.roblox.com/v1/games?universeIds={rootid}')
-            data = r.json()
-            return Game(data['data'][0])
-        except KeyError:
-            raise GameNotFound(f"Game {id} does not exist.")
+            data = r.json()['data'][0]
+        except (KeyError, IndexError):
+            raise GameNotFound(f"Game {rootid} does not exist.")
+        if self.store:
+            self.store.put_game(data)
+        return Game(data)
 
     def fetch_group(self, id: int):
         r"""
@@ -690,11 +1546,80 @@ class Client(object):
         client.login("roblosecurity")
         """
 
-        try:
-            r = self.requests.get(f'https://groups.roblox.com/v1/groups/{id}')
-            return Group(r.json())
-        except KeyError:
-            raise GroupNotFound(f"Group {id} does not exist.")
+        if self.store:
+            data = self.store.get_group(id)
+            if data:
+                return Group(data, self.store)
+        data = self._fetch_group_json(id)
+        if self.store:
+            self.store.put_group(data)
+        return Group(data, self.store)
+
+    def _fetch_group_json(self, id: int):
+        return fetch_group_json(self.requests, id)
+
+    def fetch_groups(self, ids, full: bool = False, max_workers: int = 8):
+        r"""
+        This function fetches many groups at once.
+        Like this:
+
+        -----------
+        import roblox
+
+        client = roblox.Client(email="email@example.com", username="Example", password="Example")
+
+        # A dict of id -> Group, or GroupNotFound for the ids that failed.
+        groups = client.fetch_groups(ids=[1, 2, 3])
+
+        client.login("roblosecurity")
+        -----------
+
+        The ids are looked up 100 at a time on the batch endpoint. The fields it does not return
+        (shout, member count...) are fetched when they are first read, or right away with concurrent
+        single fetches when ``full`` is True. The owner is one of those fields, the batch endpoint
+        only gives its id and type.
+        """
+
+        ids = list(dict.fromkeys(int(id) for id in ids))
+        found = {}
+        if self.store:
+            for id in ids:
+                data = self.store.get_group(id)
+                if data:
+                    found[id] = data
+        stored = set(found)
+
+        def fetch_batch(chunk):
+            r = self.requests.get('https://groups.roblox.com/v2/groups', params={'groupIds': ','.join(map(str, chunk))})
+            if r.status_code != 200:
+                raise Forbidden(error_message(r.json()))
+            # The batch owner is {'id', 'type'}, it is dropped so the owner always has the single endpoint's shape.
+            return {group['id']: {key: value for key, value in group.items() if key != 'owner'} for group in r.json()['data']}
+
+        chunks = list(chunked([id for id in ids if id not in found], 100))
+        for chunk, result in zip(chunks, gather(fetch_batch, chunks, max_workers)):
+            if isinstance(result, Exception):
+                # The batch endpoint refused this chunk, every id of it is fetched alone.
+                found.update({id: {} for id in chunk})
+            else:
+                found.update(result)
+
+        errors = {}
+        incomplete = [id for id, data in found.items() if not data or (full and any(field not in data for field in GROUP_FIELDS))]
+        for id, result in zip(incomplete, gather(self._fetch_group_json, incomplete, max_workers)):
+            if isinstance(result, Exception):
+                errors[id] = result
+                del found[id]
+            else:
+                found[id] = {**found[id], **result}
+
+        if self.store:
+            for id, data in found.items():
+                # A partial payload is not stored, fetch_group would serve it back as a full group.
+                if id not in stored and all(field in data for field in GROUP_FIELDS):
+                    self.store.put_group(data)
+
+        return {id: Group(found[id], self.store) if id in found else errors.get(id, GroupNotFound(f"Group {id} does not exist.")) for id in ids}
     
     def get_user(self, _name: str, limit: int = 10):
         r"""
@@ -714,18 +1639,91 @@ class Client(object):
 
         try:
             _r = self.requests.get(f'https://users.roblox.com/v1/users/search?keyword={_name}&limit={limit}')
-            __users__ = []
             data = _r.json()
-            for user in data['data']:
-                id = user['id']
-                r = self.requests.get(f'{self.base_url}/users/{id}')
-                user = User(r.json(), self.bot)
-                __users__.append(user)
-            self.requests.close()
-            return __users__
+            ids = [user['id'] for user in data['data']]
+            if self.store:
+                self.store.put_usernames({user['name']: user['id'] for user in data['data']})
         except KeyError:
             raise ValueError(f"Allowed values for the limit: 10, 25, 50, 100")
 
+        __users__ = []
+        for user in gather(self.fetch_user, ids):
+            if isinstance(user, UserNotFound):
+                continue
+            if isinstance(user, Exception):
+                raise user
+            __users__.append(user)
+        self.requests.close()
+        return __users__
+
+    def resolve_usernames(self, names, max_workers: int = 8):
+        r"""
+        This function gets the ids of many usernames at once.
+        Like this:
+
+        -----------
+        import roblox
+
+        client = roblox.Client(email="email@example.com", username="Example", password="Example")
+
+        # A dict of username -> id, UserNotFound for the usernames that do not exist,
+        # or the error of the request for the usernames that could not be resolved.
+        ids = client.resolve_usernames(names=["Roblox", "builderman"])
+
+        client.login("roblosecurity")
+        -----------
+
+        The usernames are resolved 100 at a time, and the ones the store already knows are not requested.
+        """
+
+        names = list(dict.fromkeys(names))
+        found = {}
+        if self.store:
+            for name in names:
+                id = self.store.get_user_id(name)
+                if id:
+                    found[name.lower()] = id
+
+        def resolve_batch(chunk):
+            r = self.requests.post('https://users.roblox.com/v1/usernames/users', json={"usernames": chunk, "excludeBannedUsers": False})
+            if r.status_code != 200:
+                raise Forbidden(error_message(r.json(), f"Usernames could not be resolved ({r.status_code})."))
+            return {user['requestedUsername']: user['id'] for user in r.json()['data']}
+
+        chunks = list(chunked([name for name in names if name.lower() not in found], 100))
+        for chunk, result in zip(chunks, gather(resolve_batch, chunks, max_workers)):
+            if isinstance(result, Exception):
+                # These names were not answered, the error is reported instead of a false UserNotFound.
+                found.update({name.lower(): result for name in chunk})
+                continue
+            if self.store:
+                self.store.put_usernames(result)
+            found.update({name.lower(): id for name, id in result.items()})
+
+        return {name: found.get(name.lower(), UserNotFound(f"User {name} does not exist.")) for name in names}
+
+    def message_queue(self, roblosecurity: str = None, **kwargs):
+        r"""
+        This function builds a MessageQueue sending from the account of the cookie,
+        or from every logged in account when no cookie is given.
+        Like this:
+
+        -----------
+        import roblox
+
+        client = roblox.Client(email="email@example.com", username="Example", password="Example")
+
+        async def notify(ids):
+            async with client.message_queue("roblosecurity", rate=5) as queue:
+                for id in ids:
+                    queue.send(id, "Hello", "World")
+        -----------
+        """
+
+        if roblosecurity is None:
+            return MessageQueue(self.sessions, **kwargs)
+        return MessageQueue(AuthSession(roblosecurity, self.headers), close_session=True, **kwargs)
+
     def listen(self):
         r"""
         This function is called when the group is printed.
@@ -768,33 +1766,67 @@ class Client(object):
         client.login("roblosecurity")
         """
 
-        async def login_async():
-            cookies = {'.ROBLOSECURITY': roblosecurity}
-            _session = requests.Session()
-            _session.cookies[".ROBLOSECURITY"] = roblosecurity
-            req = _session.post(url="https://auth.roblox.com/v2/logout")
-            req.close()
-            async with aiohttp.ClientSession(headers={"X-CSRF-TOKEN": req.headers["X-CSRF-Token"]}, cookies=cookies) as session:
-                async with session.post('https://www.roblox.com/', data={"ctype": self.email, "cvalue": self.username, "password": self.password, "captchaToken": "None", "captchaProvider": "PROVIDER_ARKOSE_LABS"}) as resp:
-                    if resp.status == 200:
-                        for event in self.events:
-                            if event == "on_ready":
-                                try:
-                                    self.__getattribute__(event)(self.bot)
-                                except AttributeError:
-                                    pass
-                    else:
-                        raise LoginError((await resp.json())['errors'][0]['message'])
         try:
             loop = asyncio.get_event_loop()
-            loop.create_task(login_async())
+            loop.create_task(self.start(roblosecurity))
             loop.run_forever()
         except KeyboardInterrupt:
             loop.stop()
             loop.run_forever()
-            loop.run_until_complete(self.session.close())
+            loop.run_until_complete(self.close())
             raise Logout("Logged out.")
 
+    async def start(self, roblosecurity: str):
+        r"""
+        This function logs the client's account in from the running event loop.
+        Like this:
+
+        -----------
+        import asyncio, roblox
+
+        client = roblox.Client(email="email@example.com", username="Example", password="Example")
+
+        async def main():
+            try:
+                await client.start("roblosecurity")
+                await client.add_account("another roblosecurity")
+                status, data = await client.sessions.request('GET', 'https://users.roblox.com/v1/users/authenticated')
+            finally:
+                await client.close()
+
+        asyncio.run(main())
+        -----------
+        """
+
+        session = self.sessions.add(roblosecurity)
+        await session.refresh_csrf()
+        status, data = await session.request('POST', 'https://www.roblox.com/', data={"ctype": self.email, "cvalue": self.username, "password": self.password, "captchaToken": "None", "captchaProvider": "PROVIDER_ARKOSE_LABS"})
+        if status != 200:
+            await self.sessions.remove(session)
+            raise LoginError(error_message(data, 'Login failed.'))
+        for event in self.events:
+            if event == "on_ready":
+                try:
+                    self.__getattribute__(event)(self.bot)
+                except AttributeError:
+                    pass
+
+    async def add_account(self, roblosecurity: str):
+        r"""
+        This function adds another account to the pool of sessions, the authenticated requests are spread across them.
+
+        The cookie is checked on its own account with users/authenticated, the client's credentials
+        are not used and on_ready is not called again. LoginError is raised for an invalid cookie.
+        """
+
+        session = self.sessions.add(roblosecurity)
+        try:
+            await session.fetch_user_id()
+        except LoginError:
+            await self.sessions.remove(session)
+            raise
+        return session
+
 # made with ❤️ by @Artic#3065
 
 # You can add the ArticBoat test robot to Roblox. (there may be surprises in the near future)
\ No newline at end of file
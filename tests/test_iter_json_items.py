@@ -0,0 +1,52 @@
+import json
+
+import pytest
+
+roblox = pytest.importorskip("roblox")
+
+DOCUMENTS = [
+    [{"Id": 1}, 7, "s", -0.5],
+    [1.5, 2e3, -0.25e-2, 10, True, False, None],
+    {"previousPageCursor": None, "nextPageCursor": "abc", "data": [{"id": 1, "name": "é🎮\"x\\"}, 12345, 0.5]},
+    {"data": [{"data": [1]}, 2], "count": 2.75},
+    {"x": {"data": [9]}, "data": [1], "y": 3},
+    {"data": []},
+    [],
+]
+
+def parse(chunks):
+    meta = {}
+    items = list(roblox.iter_json_items(iter(chunks), 'data', meta))
+    return items, meta
+
+def expected(document):
+    if isinstance(document, list):
+        return document, {}
+    return document['data'], {key: value for key, value in document.items() if key != 'data'}
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+@pytest.mark.parametrize("indent", [None, 2])
+def test_every_split(document, indent):
+    data = json.dumps(document, ensure_ascii=False, indent=indent).encode()
+    for i in range(len(data) + 1):
+        assert parse([data[:i], data[i:]]) == expected(document)
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+@pytest.mark.parametrize("size", [1, 2, 3, 7])
+def test_small_chunks(document, size):
+    data = json.dumps(document, ensure_ascii=False).encode()
+    assert parse([data[i:i + size] for i in range(0, len(data), size)]) == expected(document)
+
+@pytest.mark.parametrize("chunks, items", [
+    ([b'[1.', b'5]'], [1.5]),
+    ([b'[2e', b'3]'], [2000.0]),
+    ([b'[-', b'1]'], [-1]),
+    ([b'[tr', b'ue, nu', b'll]'], [True, None]),
+    ([b'{"nextPageCursor": 12', b'3, "data": [4]}'], [4]),
+])
+def test_cut_scalars(chunks, items):
+    assert parse(chunks)[0] == items
+
+def test_unterminated_array():
+    with pytest.raises(ValueError):
+        parse([b'[1, 2'])